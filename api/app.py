@@ -17,6 +17,9 @@ CORS(app)
 # Global model cache
 models_cache = {}
 
+# Maximum rows returned by /api/analytics (Supabase's default row limit)
+MAX_ANALYTICS_LIMIT = 1000
+
 def get_supabase_client():
     """Get Supabase client"""
     from supabase import create_client
@@ -230,6 +233,136 @@ def get_products():
         }), 500
 
 
+@app.route("/api/analytics", methods=["GET"])
+def get_analytics():
+    """
+    Get precomputed product × city × day price aggregates
+
+    Query parameters (all optional):
+        product: Product name, e.g. "Potatoes"
+        city: One or more cities, comma-separated, e.g. "Nanjing,Suzhou"
+        date: A single day (YYYY-MM-DD), or "latest" for the most recent day
+        start_date, end_date: Inclusive date range (YYYY-MM-DD)
+        limit: Maximum rows to return (default and maximum 1000)
+        offset: Rows to skip, for paging through larger results (default 0)
+
+    Rows are ordered by date, product and city. "truncated" is true when more rows
+    match than were returned; request them with offset=next_offset.
+    """
+    try:
+        product = request.args.get("product")
+        cities = [c.strip() for c in request.args.get("city", "").split(",") if c.strip()]
+        date = request.args.get("date")
+        start_date = request.args.get("start_date")
+        end_date = request.args.get("end_date")
+        raw_limit = request.args.get("limit", str(MAX_ANALYTICS_LIMIT))
+        raw_offset = request.args.get("offset", "0")
+
+        try:
+            limit = int(raw_limit)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return jsonify({
+                "success": False,
+                "error": f"Invalid limit '{raw_limit}', expected a positive integer"
+            }), 400
+        limit = min(limit, MAX_ANALYTICS_LIMIT)
+
+        try:
+            offset = int(raw_offset)
+        except ValueError:
+            offset = -1
+        if offset < 0:
+            return jsonify({
+                "success": False,
+                "error": f"Invalid offset '{raw_offset}', expected a non-negative integer"
+            }), 400
+
+        if date and (start_date or end_date):
+            return jsonify({
+                "success": False,
+                "error": "Use either date or start_date/end_date, not both"
+            }), 400
+
+        for value in (start_date, end_date, None if date == "latest" else date):
+            if value:
+                try:
+                    datetime.strptime(value, "%Y-%m-%d")
+                except ValueError:
+                    return jsonify({
+                        "success": False,
+                        "error": f"Invalid date '{value}', expected YYYY-MM-DD"
+                    }), 400
+
+        supabase = get_supabase_client()
+
+        def build_query(columns, count=None):
+            query = supabase.table("price_analytics_cube").select(columns, count=count)
+            if product:
+                query = query.eq("product_name", product)
+            if cities:
+                query = query.in_("city", cities)
+            return query
+
+        if date == "latest":
+            latest_response = build_query("date").order("date", desc=True).limit(1).execute()
+            if not latest_response.data:
+                return jsonify({
+                    "success": True,
+                    "count": 0,
+                    "total": 0,
+                    "truncated": False,
+                    "next_offset": None,
+                    "analytics": []
+                })
+            date = latest_response.data[0]["date"]
+
+        query = build_query(
+            "product_name, city, date, avg_price, min_price, max_price, sample_count, "
+            "day_change, day_change_pct, provincial_avg, spread, spread_pct",
+            count="exact"
+        )
+        if date:
+            query = query.eq("date", date)
+        if start_date:
+            query = query.gte("date", start_date)
+        if end_date:
+            query = query.lte("date", end_date)
+
+        from postgrest.exceptions import APIError
+        try:
+            response = query\
+                .order("date", desc=False)\
+                .order("product_name", desc=False)\
+                .order("city", desc=False)\
+                .range(offset, offset + limit - 1)\
+                .execute()
+            rows, total = response.data, response.count
+        except APIError as e:
+            # PostgREST rejects an offset past the end of the results
+            if e.code != "PGRST103":
+                raise
+            rows, total = [], None
+
+        truncated = total is not None and offset + len(rows) < total
+
+        return jsonify({
+            "success": True,
+            "count": len(rows),
+            "total": total,
+            "truncated": truncated,
+            "next_offset": offset + len(rows) if truncated else None,
+            "analytics": rows
+        })
+
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
@@ -0,0 +1,12 @@
+/*
+  # Add Active Price Alerts Index
+
+  ## Indexes
+  - Partial index on `price_alerts` (product_id, city) for active alerts, so the
+    price-alert evaluator (`evaluate_price_alerts.py`) can load them without
+    scanning inactive rows
+*/
+
+CREATE INDEX IF NOT EXISTS idx_price_alerts_active_product_city
+  ON price_alerts(product_id, city)
+  WHERE is_active = true;
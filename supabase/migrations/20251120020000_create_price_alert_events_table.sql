@@ -0,0 +1,58 @@
+/*
+  # Create Price Alert Events Table
+
+  ## Purpose
+  Store alerts triggered by the batch price-alert evaluator (`evaluate_price_alerts.py`),
+  which runs after each daily price load or prediction run.
+
+  ## New Tables
+
+  ### `price_alert_events`
+  - `id` (uuid, primary key) - Unique identifier
+  - `alert_id` (uuid, foreign key) - Reference to price_alerts table
+  - `user_id` (uuid, foreign key) - Owner of the alert
+  - `product_id` (uuid, foreign key) - Reference to products table
+  - `city` (text) - City whose price triggered the alert
+  - `alert_type` (text) - "above" or "below"
+  - `threshold_price` (numeric) - Threshold at evaluation time
+  - `price_source` (text) - "actual" (market_prices) or "predicted" (price_predictions)
+  - `trigger_price` (numeric) - Price that crossed the threshold
+  - `price_date` (date) - Date of the triggering price
+  - `created_at` (timestamptz) - Evaluation time
+  - Unique (alert_id, price_source, price_date) so re-running the evaluator
+    on unchanged prices does not store the same event twice
+
+  ## Security
+  - Enable RLS on `price_alert_events` table
+  - Users can only read their own alert events
+*/
+
+-- Create price_alert_events table
+CREATE TABLE IF NOT EXISTS price_alert_events (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  alert_id uuid REFERENCES price_alerts(id) ON DELETE CASCADE NOT NULL,
+  user_id uuid REFERENCES auth.users(id) ON DELETE CASCADE NOT NULL,
+  product_id uuid REFERENCES products(id) ON DELETE CASCADE NOT NULL,
+  city text NOT NULL,
+  alert_type text NOT NULL CHECK (alert_type IN ('above', 'below')),
+  threshold_price numeric(10, 2) NOT NULL,
+  price_source text NOT NULL CHECK (price_source IN ('actual', 'predicted')),
+  trigger_price numeric(10, 2) NOT NULL,
+  price_date date NOT NULL,
+  created_at timestamptz DEFAULT now() NOT NULL,
+  UNIQUE (alert_id, price_source, price_date)
+);
+
+-- Create indexes for better query performance
+CREATE INDEX IF NOT EXISTS idx_price_alert_events_user_id ON price_alert_events(user_id);
+CREATE INDEX IF NOT EXISTS idx_price_alert_events_created_at ON price_alert_events(created_at DESC);
+
+-- Enable RLS
+ALTER TABLE price_alert_events ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Users can read their own alert events
+CREATE POLICY "Users can read own price alert events"
+  ON price_alert_events
+  FOR SELECT
+  TO authenticated
+  USING (auth.uid() = user_id);
@@ -0,0 +1,86 @@
+/*
+  # Create Price Analytics Cube Table
+
+  ## Purpose
+  Store precomputed product × city × day price aggregates built by
+  `build_analytics_cube.py` after each daily price load, so dashboards read small
+  slices instead of aggregating raw `market_prices` rows per request.
+
+  ## New Tables
+
+  ### `price_analytics_cube`
+  - `id` (uuid, primary key) - Unique identifier
+  - `product_id` (uuid, foreign key) - Reference to products table
+  - `product_name` (text) - Product name, for easy querying
+  - `city` (text) - City name
+  - `date` (date) - Price date
+  - `avg_price` (numeric) - Average price across the city's markets
+  - `min_price` (numeric) - Lowest market price
+  - `max_price` (numeric) - Highest market price
+  - `sample_count` (integer) - Number of market_prices rows aggregated
+  - `day_change` (numeric, nullable) - Change in avg_price from the previous day with data
+  - `day_change_pct` (numeric, nullable) - day_change as a percentage
+  - `provincial_avg` (numeric) - Mean of all city averages for the product on that day
+  - `spread` (numeric) - avg_price minus provincial_avg
+  - `spread_pct` (numeric) - spread as a percentage of provincial_avg
+  - `updated_at` (timestamptz) - Last time the row was rebuilt
+
+  ## Indexes
+  - Unique (product_id, city, date) for incremental upserts
+  - (product_name, date) and (date) for dashboard slices
+
+  ## Security
+  - Enable RLS on `price_analytics_cube` table
+  - Public read access, like market_prices
+  - Authenticated insert/update access for the cube builder
+*/
+
+-- Create price_analytics_cube table
+CREATE TABLE IF NOT EXISTS price_analytics_cube (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  product_id uuid REFERENCES products(id) ON DELETE CASCADE NOT NULL,
+  product_name text NOT NULL,
+  city text NOT NULL,
+  date date NOT NULL,
+  avg_price numeric(10, 2) NOT NULL,
+  min_price numeric(10, 2) NOT NULL,
+  max_price numeric(10, 2) NOT NULL,
+  sample_count integer NOT NULL,
+  day_change numeric(10, 2),
+  day_change_pct numeric(8, 2),
+  provincial_avg numeric(10, 2) NOT NULL,
+  spread numeric(10, 2) NOT NULL,
+  spread_pct numeric(8, 2) NOT NULL,
+  updated_at timestamptz DEFAULT now() NOT NULL,
+  UNIQUE (product_id, city, date)
+);
+
+-- Create indexes for better query performance
+CREATE INDEX IF NOT EXISTS idx_price_analytics_cube_product_date
+  ON price_analytics_cube(product_name, date DESC);
+CREATE INDEX IF NOT EXISTS idx_price_analytics_cube_date
+  ON price_analytics_cube(date DESC);
+
+-- Enable RLS
+ALTER TABLE price_analytics_cube ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Anyone can read analytics
+CREATE POLICY "Anyone can read price analytics"
+  ON price_analytics_cube
+  FOR SELECT
+  TO authenticated, anon
+  USING (true);
+
+-- Policies: Authenticated users can write analytics (upserts need both)
+CREATE POLICY "Authenticated users can insert price analytics"
+  ON price_analytics_cube
+  FOR INSERT
+  TO authenticated
+  WITH CHECK (true);
+
+CREATE POLICY "Authenticated users can update price analytics"
+  ON price_analytics_cube
+  FOR UPDATE
+  TO authenticated
+  USING (true)
+  WITH CHECK (true);
@@ -0,0 +1,19 @@
+"""
+Supabase Helpers
+Shared query helpers for the data pipeline scripts
+"""
+
+# Supabase returns at most this many rows per request
+PAGE_SIZE = 1000
+
+
+def fetch_all_rows(build_query) -> list:
+    """Fetch every row of a query page by page"""
+    rows = []
+    start = 0
+    while True:
+        response = build_query().range(start, start + PAGE_SIZE - 1).execute()
+        rows.extend(response.data)
+        if len(response.data) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
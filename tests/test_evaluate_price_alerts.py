@@ -0,0 +1,150 @@
+"""
+Tests for the vectorized price-alert evaluator
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from evaluate_price_alerts import EVENT_COLUMNS, build_alert_index, find_triggered_alerts
+
+
+def make_alerts(rows):
+    """Build an alerts frame from (product_id, city, alert_type, threshold_price) tuples"""
+    df = pd.DataFrame(rows, columns=["product_id", "city", "alert_type", "threshold_price"])
+    df.insert(0, "id", [f"a{i}" for i in range(len(df))])
+    df.insert(1, "user_id", "u1")
+    return df
+
+
+def make_prices(rows):
+    """Build a prices frame from (product_id, city, price_source, low, low_date, high, high_date) tuples"""
+    return pd.DataFrame(rows, columns=["product_id", "city", "price_source",
+                                       "price_low", "low_date", "price_high", "high_date"])
+
+
+def actual(product_id, city, price, date="2025-11-20"):
+    return (product_id, city, "actual", price, date, price, date)
+
+
+def evaluate(alerts, prices):
+    return find_triggered_alerts(build_alert_index(alerts), alerts, prices)
+
+
+def brute_force(alerts, prices):
+    """Row-by-row reference: the best matching price per (alert, source)"""
+    best = {}
+    for alert in alerts.itertuples():
+        for price in prices.itertuples():
+            if price.product_id != alert.product_id or alert.city not in ("", price.city):
+                continue
+            if alert.alert_type == "above":
+                value, date, better = price.price_high, price.high_date, lambda a, b: a > b
+                triggered = round(value * 100) >= round(alert.threshold_price * 100)
+            else:
+                value, date, better = price.price_low, price.low_date, lambda a, b: a < b
+                triggered = round(value * 100) <= round(alert.threshold_price * 100)
+            key = (alert.id, price.price_source)
+            if triggered and (key not in best or better(value, best[key][1])):
+                best[key] = (price.city, value, date)
+    return best
+
+
+def as_dict(events):
+    return {(e.alert_id, e.price_source): (e.city, e.trigger_price, e.price_date)
+            for e in events.itertuples()}
+
+
+def test_thresholds_are_inclusive():
+    alerts = make_alerts([
+        ("p1", "Nanjing", "above", 5.00),
+        ("p1", "Nanjing", "above", 5.01),
+        ("p1", "Nanjing", "below", 5.00),
+        ("p1", "Nanjing", "below", 4.99),
+    ])
+    events = evaluate(alerts, make_prices([actual("p1", "Nanjing", 5.00)]))
+
+    assert sorted(events["alert_id"]) == ["a0", "a2"]
+
+
+def test_city_alerts_only_match_their_city():
+    alerts = make_alerts([("p1", "Nanjing", "above", 5.00), ("p2", "Nanjing", "above", 5.00)])
+    prices = make_prices([actual("p1", "Suzhou", 9.00), actual("p2", "Nanjing", 4.00)])
+
+    assert evaluate(alerts, prices).empty
+
+
+def test_alert_without_city_reports_most_extreme_city():
+    alerts = make_alerts([
+        ("p1", "", "above", 9.40),
+        ("p1", "", "below", 9.40),
+    ])
+    # Both D and B are above the largest threshold; D is loaded first
+    prices = make_prices([
+        actual("p1", "D", 10.05),
+        actual("p1", "B", 10.82),
+        actual("p1", "C", 3.10),
+        actual("p1", "A", 2.75),
+    ])
+    events = as_dict(evaluate(alerts, prices))
+
+    assert events[("a0", "actual")][:2] == ("B", 10.82)
+    assert events[("a1", "actual")][:2] == ("A", 2.75)
+    assert len(events) == 2
+
+
+def test_actual_and_predicted_sources():
+    alerts = make_alerts([("p1", "Nanjing", "above", 6.00), ("p1", "Nanjing", "below", 4.00)])
+    prices = make_prices([
+        actual("p1", "Nanjing", 5.00),
+        ("p1", "Nanjing", "predicted", 3.90, "2025-11-22", 6.20, "2025-11-21"),
+    ])
+    events = as_dict(evaluate(alerts, prices))
+
+    assert events == {
+        ("a0", "predicted"): ("Nanjing", 6.20, "2025-11-21"),
+        ("a1", "predicted"): ("Nanjing", 3.90, "2025-11-22"),
+    }
+
+
+def test_empty_alerts_or_prices():
+    alerts = make_alerts([("p1", "Nanjing", "above", 1.00)])
+    prices = make_prices([actual("p1", "Nanjing", 5.00)])
+
+    for events in (evaluate(make_alerts([]), prices), evaluate(alerts, make_prices([]))):
+        assert events.empty
+        assert list(events.columns) == EVENT_COLUMNS
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(7)
+    products = ["p1", "p2", "p3"]
+    cities = ["A", "B", "C", "D"]
+    alerts = make_alerts(zip(rng.choice(products, 300), rng.choice(cities + [""], 300),
+                             rng.choice(["above", "below"], 300),
+                             np.round(rng.uniform(1, 10, 300), 2)))
+    rows = []
+    for product in products:
+        for city in cities:
+            price = round(rng.uniform(0.5, 12), 2)
+            rows.append(actual(product, city, price))
+            rows.append((product, city, "predicted", round(price - 1, 2), "low",
+                         round(price + 1, 2), "high"))
+    prices = make_prices(rows)
+
+    assert as_dict(evaluate(alerts, prices)) == brute_force(alerts, prices)
+
+
+def test_300k_alerts_evaluate_under_a_second():
+    rng = np.random.default_rng(0)
+    n = 300_000
+    products = [f"p{i}" for i in range(30)]
+    cities = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M"]
+    alerts = make_alerts(zip(rng.choice(products, n), rng.choice(cities + [""], n),
+                             rng.choice(["above", "below"], n),
+                             np.round(rng.uniform(1, 20, n), 2)))
+    prices = make_prices([actual(p, c, round(rng.uniform(1, 20), 2)) for p in products for c in cities])
+
+    started = time.perf_counter()
+    evaluate(alerts, prices)
+    assert time.perf_counter() - started < 1.0